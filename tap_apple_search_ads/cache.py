@@ -0,0 +1,97 @@
+"""Campaign metadata cache shared by the AppleSearchAds streams."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import logging
+
+# Campaign attributes kept in the cache, next to the budget currency.
+CAMPAIGN_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "servingStatus",
+    "displayStatus",
+    "startTime",
+    "endTime",
+    "modificationTime",
+    "deleted",
+)
+
+
+class CampaignMetadataCache:
+    """TTL-bounded cache of campaign attributes, keyed by org id and campaign id.
+
+    The cache lives in memory for the duration of a sync and is persisted to `path`
+    when one is given, so later runs only need to fetch campaigns modified since the
+    last refresh.
+    """
+
+    def __init__(self, path: str | None, ttl: int, logger: logging.Logger) -> None:
+        """Create a new cache instance.
+
+        Args:
+            path: Optional path of the JSON file to persist the cache to.
+            ttl: Number of seconds after which the campaigns of an org must be refreshed.
+            logger: The logger to report an unreadable cache file to.
+        """
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self._orgs: dict[str, dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            try:
+                orgs = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                orgs = None
+            if isinstance(orgs, dict):
+                self._orgs = orgs
+            else:
+                logger.warning("Ignoring unreadable campaign cache file %s", self.path)
+
+    def _get_org(self, org_id: str) -> dict[str, Any]:
+        return self._orgs.setdefault(
+            str(org_id),
+            {"refreshed_at": None, "max_modification_time": None, "campaigns": {}},
+        )
+
+    def is_fresh(self, org_id: str) -> bool:
+        """Return whether the campaigns of an org were refreshed within the TTL."""
+        refreshed_at = self._get_org(org_id)["refreshed_at"]
+        return refreshed_at is not None and time.time() - refreshed_at < self.ttl
+
+    def max_modification_time(self, org_id: str) -> str | None:
+        """Return the latest `modificationTime` seen for an org, if any."""
+        return self._get_org(org_id)["max_modification_time"]
+
+    def get(self, org_id: str, campaign_id: int) -> dict | None:
+        """Return the cached attributes of a campaign, or None if it is unknown."""
+        return self._get_org(org_id)["campaigns"].get(str(campaign_id))
+
+    def update(self, org_id: str, campaign: dict) -> None:
+        """Add or replace a campaign record in the cache."""
+        org = self._get_org(org_id)
+        metadata = {field: campaign.get(field) for field in CAMPAIGN_FIELDS}
+        metadata["currency"] = (campaign.get("budgetAmount") or campaign.get("dailyBudgetAmount") or {}).get(
+            "currency"
+        )
+        org["campaigns"][str(campaign["id"])] = metadata
+        modification_time = campaign.get("modificationTime")
+        if modification_time and (
+            org["max_modification_time"] is None or modification_time > org["max_modification_time"]
+        ):
+            org["max_modification_time"] = modification_time
+
+    def mark_refreshed(self, org_id: str) -> None:
+        """Mark the campaigns of an org as refreshed and persist the cache."""
+        self._get_org(org_id)["refreshed_at"] = time.time()
+        if self.path:
+            # Write to a temporary file first so an interrupted run never leaves a truncated cache behind.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            tmp_path.write_text(json.dumps(self._orgs))
+            tmp_path.replace(self.path)
@@ -13,6 +13,9 @@ from tap_apple_search_ads.auth import AppleSearchAdsAuthenticator
 if TYPE_CHECKING:
     from singer_sdk.helpers.types import Context
 
+    from tap_apple_search_ads.cache import CampaignMetadataCache
+    from tap_apple_search_ads.tap import TapAppleSearchAds
+
 PAGE_LIMIT = 1000
 
 
@@ -47,6 +50,11 @@ class AppleSearchAdsStream(RESTStream):
             },
         )
 
+    @property
+    def campaign_cache(self) -> CampaignMetadataCache:
+        """Return the campaign metadata cache shared by the streams of the tap."""
+        return t.cast("TapAppleSearchAds", self._tap).campaign_cache
+
     @property
     def partitions(self) -> list[dict] | None:
         """Return a list of partitions, or None if the stream is not partitioned."""
@@ -54,7 +62,13 @@ class AppleSearchAdsStream(RESTStream):
             return None
         return [{"org_id": org_id} for org_id in self.config["org_ids"]]
 
-    def get_records(self, context: Context) -> t.Iterable[dict[str, t.Any]]:
+    def _get_org_id(self, context: Context | None) -> str:
+        """Get the organisation ID for a stream partition."""
+        if self.partitions is None:
+            return self.config["org_id"]
+        return t.cast("Context", context)["org_id"]
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
         """Return a generator of record-type dictionary objects.
 
         Each record emitted should be a dictionary of property names to their values.
@@ -65,10 +79,7 @@ class AppleSearchAdsStream(RESTStream):
         Yields:
             One item per (possibly processed) record in the API.
         """
-        if self.partitions is None:
-            self.org_id = self.config["org_id"]
-        else:
-            self.org_id = context["org_id"]
+        self.org_id = self._get_org_id(context)
         for record in self.request_records(context):
             transformed_record = self.post_process(record, context)
             if transformed_record is None:
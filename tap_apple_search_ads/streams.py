@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 from typing import NamedTuple
 
 from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.pagination import BaseOffsetPaginator
 
 from tap_apple_search_ads.client import PAGE_LIMIT, AppleSearchAdsStream
 
@@ -18,6 +19,13 @@ if t.TYPE_CHECKING:
 
 _TToken = t.TypeVar("_TToken")
 
+# Key under which granular report streams keep their in-progress page in state.
+PAGE_CHECKPOINT_KEY = "page_checkpoint"
+
+# Campaigns modified this long before the latest cached modification are fetched again, so
+# campaigns modified within the same timestamp unit after the last refresh are not missed.
+MODIFICATION_TIME_OVERLAP = timedelta(minutes=1)
+
 
 class GranularityConfig(NamedTuple):
     """Configuration for granularity settings."""
@@ -35,6 +43,70 @@ class CampaignsStream(AppleSearchAdsStream):
     primary_keys: t.ClassVar[list[str]] = ["id"]
     schema = campaigns_schema
 
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return a generator of record-type dictionary objects.
+
+        Every campaign is added to the tap's campaign metadata cache on the way out.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        cache = self.campaign_cache
+        for record in super().get_records(context):
+            cache.update(self.org_id, record)
+            yield record
+        cache.mark_refreshed(self.org_id)
+
+
+class CampaignMetadataStream(CampaignsStream):
+    """Campaigns modified since the last refresh of the campaign metadata cache.
+
+    This stream is not discovered, it is only used to refresh the cache for report streams.
+    """
+
+    name = "campaign_metadata"
+    path = "/campaigns/find"
+    rest_method = "POST"
+
+    def get_url_params(
+        self,
+        context: Context | None,  # noqa: ARG002
+        next_page_token: t.Any | None,  # noqa: ARG002, ANN401
+    ) -> dict[str, t.Any]:
+        """Return no URL parameters, the selector is sent in the payload instead."""
+        return {}
+
+    def prepare_request_payload(
+        self,
+        context: Context | None,  # noqa: ARG002
+        next_page_token: _TToken | None,
+    ) -> dict:
+        """Prepare the selector for campaigns modified since the last refresh.
+
+        Args:
+            context: Stream partition or context dictionary.
+            next_page_token: Token, page number or any request argument to request the
+                next page of data.
+        """
+        payload = {
+            "orderBy": [{"field": "id", "sortOrder": "ASCENDING"}],
+            "pagination": {"offset": next_page_token, "limit": PAGE_LIMIT},
+        }
+        max_modification_time = self.campaign_cache.max_modification_time(self.org_id)
+        if max_modification_time:
+            modified_after = datetime.fromisoformat(max_modification_time) - MODIFICATION_TIME_OVERLAP
+            payload["conditions"] = [
+                {
+                    "field": "modificationTime",
+                    "operator": "GREATER_THAN",
+                    "values": [modified_after.isoformat(timespec="milliseconds")],
+                },
+            ]
+        return payload
+
 
 class ReportStream(AppleSearchAdsStream):
     """Base class for report streams.
@@ -45,6 +117,30 @@ class ReportStream(AppleSearchAdsStream):
     rest_method = "POST"
     records_jsonpath = "$.data.reportingDataResponse.row[*]"
 
+    _campaign_metadata_stream: CampaignMetadataStream | None = None
+
+    def get_campaign_metadata(self, campaign_id: int, context: Context | None) -> dict | None:
+        """Look up the cached attributes of a campaign.
+
+        When the TTL of the org's cached campaigns has expired, this first requests the
+        campaigns modified since the last refresh from the API.
+
+        Args:
+            campaign_id: The campaign ID.
+            context: Stream partition or context dictionary of the campaign's org.
+
+        Returns:
+            The campaign attributes, or `None` if the campaign is unknown.
+        """
+        org_id = self._get_org_id(context)
+        cache = self.campaign_cache
+        if not cache.is_fresh(org_id):
+            if self._campaign_metadata_stream is None:
+                self._campaign_metadata_stream = CampaignMetadataStream(self._tap)
+            for _ in self._campaign_metadata_stream.get_records(context):
+                pass
+        return cache.get(org_id, campaign_id)
+
     @property
     def schema(self) -> dict:
         """Return schema with primary key added."""
@@ -118,6 +214,11 @@ class GranularReportsStream(ReportStream):
 
     replication_key = "date"
 
+    _report_window: tuple[datetime, datetime] | None = None
+    _resume_offset: int | None = None
+    _resume_after_id: int | None = None
+    _last_emitted_id: int | None = None
+
     # Granularity configuration mapping
     GRANULARITY_CONFIGS: t.ClassVar[dict[str, GranularityConfig]] = {
         "HOURLY": GranularityConfig(days=30, min_interval=0, max_interval=7),
@@ -166,6 +267,132 @@ class GranularReportsStream(ReportStream):
             return max_end_date
         return end_date
 
+    def _get_report_window(self, context: Context | None) -> tuple[datetime, datetime]:
+        """Get the report window, fixed for the duration of a partition sync."""
+        if self._report_window is None:
+            config = self.GRANULARITY_CONFIGS[self.config["report_granularity"]]
+            now = datetime.now(tz=timezone.utc)
+            start_date = self._get_initial_start_date(context)
+            start_date = self._adjust_start_date(start_date, config, now)
+            end_date = self._adjust_end_date(now, start_date, config)
+            self._report_window = (start_date, end_date)
+        return self._report_window
+
+    def _restore_page_checkpoint(self, context: Context | None) -> None:
+        """Restore the window and offset of an interrupted sync, if its checkpoint is still valid."""
+        checkpoint = self.get_context_state(context).get(PAGE_CHECKPOINT_KEY)
+        if not checkpoint:
+            return
+        granularity = self.config["report_granularity"]
+        if checkpoint.get("org_id") != str(self._get_org_id(context)) or checkpoint.get("granularity") != granularity:
+            self.logger.info("Discarding page checkpoint for a different org or granularity: %s", checkpoint)
+            return
+        try:
+            start_date = datetime.fromisoformat(checkpoint["window_start"]).replace(tzinfo=timezone.utc)
+            end_date = datetime.fromisoformat(checkpoint["window_end"]).replace(tzinfo=timezone.utc)
+            offset = checkpoint["offset"]
+        except (KeyError, TypeError, ValueError):
+            offset = None
+        last_emitted_id = checkpoint.get("last_emitted_id")
+        if (
+            type(offset) is not int
+            or offset < 0
+            or end_date < start_date
+            or (last_emitted_id is not None and type(last_emitted_id) is not int)
+        ):
+            self.logger.warning("Discarding malformed page checkpoint: %s", checkpoint)
+            return
+        min_start_date = datetime.now(tz=timezone.utc) - timedelta(days=self.GRANULARITY_CONFIGS[granularity].days)
+        if start_date.date() < min_start_date.date():
+            self.logger.info(
+                "Discarding page checkpoint, its window starting %s is no longer available for this granularity",
+                checkpoint["window_start"],
+            )
+            return
+        self.logger.info(
+            "Resuming report window %s to %s at offset %s",
+            checkpoint["window_start"],
+            checkpoint["window_end"],
+            offset,
+        )
+        self._report_window = (start_date, end_date)
+        self._resume_offset = offset
+        self._resume_after_id = last_emitted_id
+        self._last_emitted_id = last_emitted_id
+
+    def _write_page_checkpoint(self, context: Context | None, offset: int) -> None:
+        """Persist the window and offset of the next page to state.
+
+        This is called right before a page is requested, at which point every record of
+        the previous pages has been emitted.
+        """
+        start_date, end_date = self._get_report_window(context)
+        self.get_context_state(context)[PAGE_CHECKPOINT_KEY] = {
+            "org_id": str(self.org_id),
+            "granularity": self.config["report_granularity"],
+            "window_start": start_date.strftime("%Y-%m-%d"),
+            "window_end": end_date.strftime("%Y-%m-%d"),
+            "offset": offset,
+            "last_emitted_id": self._last_emitted_id,
+        }
+        # No record may have been emitted since the last state message if a whole page was deduplicated.
+        self._is_state_flushed = False
+        self._write_state_message()
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return a generator of record-type dictionary objects.
+
+        When `checkpoint_report_pages` is enabled, an interrupted sync of the partition is
+        resumed from the last checkpointed page and the checkpoint is cleared once the
+        window has been synced completely.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        self._report_window = None
+        self._resume_offset = None
+        self._resume_after_id = None
+        self._last_emitted_id = None
+        if self.config.get("checkpoint_report_pages"):
+            self._restore_page_checkpoint(context)
+        yield from super().get_records(context)
+        self.get_context_state(context).pop(PAGE_CHECKPOINT_KEY, None)
+        self._resume_offset = None
+        self._resume_after_id = None
+
+    def get_new_paginator(self) -> BaseOffsetPaginator:
+        """Create a new pagination helper instance, starting at the checkpointed offset if resuming.
+
+        Returns:
+            A pagination helper instance.
+        """
+        if self._resume_offset:
+            return BaseOffsetPaginator(self._resume_offset, PAGE_LIMIT)
+        return super().get_new_paginator()
+
+    def prepare_request(
+        self,
+        context: Context | None,
+        next_page_token: _TToken | None,
+    ) -> requests.PreparedRequest:
+        """Prepare a request object, checkpointing the page first if enabled.
+
+        Args:
+            context: Stream partition or context dictionary.
+            next_page_token: Token, page number or any request argument to request the
+                next page of data.
+
+        Returns:
+            Build a request with the stream's URL, path, query parameters,
+            HTTP headers and authenticator.
+        """
+        if self.config.get("checkpoint_report_pages") and next_page_token:
+            self._write_page_checkpoint(context, t.cast(int, next_page_token))
+        return super().prepare_request(context, next_page_token)
+
     def prepare_request_payload(
         self,
         context: Context | None,
@@ -179,15 +406,9 @@ class GranularReportsStream(ReportStream):
                 next page of data.
         """
         payload = super().prepare_request_payload(context, next_page_token)
-        granularity = self.config["report_granularity"]
-        config = self.GRANULARITY_CONFIGS[granularity]
+        payload["granularity"] = self.config["report_granularity"]
 
-        payload["granularity"] = granularity
-
-        now = datetime.now(tz=timezone.utc)
-        start_date = self._get_initial_start_date(context)
-        start_date = self._adjust_start_date(start_date, config, now)
-        end_date = self._adjust_end_date(now, start_date, config)
+        start_date, end_date = self._get_report_window(context)
 
         payload.update(
             {
@@ -214,6 +435,32 @@ class GranularReportsStream(ReportStream):
                 granular_record["metadata"] = record["metadata"]
                 yield granular_record
 
+    def post_process(
+        self,
+        row: Record,
+        context: Context | None = None,
+    ) -> dict | None:
+        """As needed, append or transform raw data to match expected structure.
+
+        Rows are ordered by the report key, so when resuming from a checkpoint any row at
+        or before the last emitted key was already synced and is dropped.
+
+        Args:
+            row: Individual record in the stream.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The resulting record dict, or `None` if the record should be excluded.
+        """
+        processed_row = super().post_process(row, context)
+        if processed_row is None:
+            return None
+        report_id = processed_row[t.cast("list[str]", self.primary_keys)[0]]
+        if self._resume_after_id is not None and report_id <= self._resume_after_id:
+            return None
+        self._last_emitted_id = report_id
+        return processed_row
+
 
 class CampaignReportsStream(ReportStream):
     """Campaign reports stream."""
@@ -6,7 +6,9 @@ from datetime import datetime, timezone
 
 from singer_sdk import Tap
 from singer_sdk.typing import (
+    BooleanType,
     DateType,
+    IntegerType,
     PropertiesList,
     Property,
     StringType,
@@ -14,6 +16,7 @@ from singer_sdk.typing import (
 )  # JSON schema typing helpers
 
 from tap_apple_search_ads import streams
+from tap_apple_search_ads.cache import CampaignMetadataCache
 
 
 class TapAppleSearchAds(Tap):
@@ -64,6 +67,26 @@ class TapAppleSearchAds(Tap):
             description=("The granularity of reporting streams. " "One of HOURLY, DAILY, WEEKLY, MONTHLY."),
             allowed_values=["HOURLY", "DAILY", "WEEKLY", "MONTHLY"],
         ),
+        Property(
+            "checkpoint_report_pages",
+            BooleanType,
+            description="Store the in-progress report window and page offset in state, so an interrupted sync of "
+            "a granular reporting stream resumes from the last emitted page instead of restarting the window.",
+            default=False,
+        ),
+        Property(
+            "campaign_cache_path",
+            StringType,
+            description="Path of a JSON file to persist the campaign metadata cache to between runs. If not set, "
+            "the cache is only kept in memory for the duration of the sync.",
+        ),
+        Property(
+            "campaign_cache_ttl",
+            IntegerType,
+            description="Number of seconds after which the cached campaigns of an organisation are refreshed with "
+            "the campaigns modified since the last refresh.",
+            default=3600,
+        ),
     ).to_dict()
 
     def __init__(self, *args, **kwargs):
@@ -75,6 +98,11 @@ class TapAppleSearchAds(Tap):
         ):
             msg = "You must provide either `org_id` or `org_ids` in the config."
             raise ValueError(msg)
+        self.campaign_cache = CampaignMetadataCache(
+            path=self.config.get("campaign_cache_path"),
+            ttl=self.config["campaign_cache_ttl"],
+            logger=self.logger,
+        )
 
     def discover_streams(self) -> list[streams.AppleSearchAdsStream]:
         """Return a list of discovered streams.
@@ -0,0 +1,80 @@
+"""Tests for the campaign metadata cache."""
+
+from __future__ import annotations
+
+import logging
+
+from tap_apple_search_ads import cache as cache_module
+from tap_apple_search_ads.cache import CampaignMetadataCache
+
+LOGGER = logging.getLogger(__name__)
+
+
+def test_is_fresh_expires_after_ttl(monkeypatch):
+    cache = CampaignMetadataCache(path=None, ttl=60, logger=LOGGER)
+    assert not cache.is_fresh("123")
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0)
+    cache.mark_refreshed("123")
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1059.0)
+    assert cache.is_fresh("123")
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1060.0)
+    assert not cache.is_fresh("123")
+
+
+def test_currency_falls_back_to_daily_budget():
+    cache = CampaignMetadataCache(path=None, ttl=60, logger=LOGGER)
+    cache.update("123", {"id": 1, "budgetAmount": {"amount": "10", "currency": "EUR"}})
+    cache.update("123", {"id": 2, "dailyBudgetAmount": {"amount": "1", "currency": "USD"}})
+    cache.update("123", {"id": 3, "budgetAmount": None})
+
+    assert cache.get("123", 1)["currency"] == "EUR"
+    assert cache.get("123", 2)["currency"] == "USD"
+    assert cache.get("123", 3)["currency"] is None
+    assert cache.get("123", 4) is None
+    assert cache.get("456", 1) is None
+
+
+def test_max_modification_time_only_moves_forward():
+    cache = CampaignMetadataCache(path=None, ttl=60, logger=LOGGER)
+    cache.update("123", {"id": 1, "modificationTime": "2026-10-02T10:00:00.000"})
+    cache.update("123", {"id": 2, "modificationTime": "2026-10-01T10:00:00.000"})
+    cache.update("123", {"id": 3})
+
+    assert cache.max_modification_time("123") == "2026-10-02T10:00:00.000"
+    assert cache.max_modification_time("456") is None
+
+
+def test_persists_across_instances(tmp_path):
+    path = tmp_path / "cache" / "campaigns.json"
+    cache = CampaignMetadataCache(path=str(path), ttl=60, logger=LOGGER)
+    cache.update("123", {"id": 1, "status": "ENABLED", "modificationTime": "2026-10-01T10:00:00.000"})
+    cache.mark_refreshed("123")
+
+    reloaded = CampaignMetadataCache(path=str(path), ttl=60, logger=LOGGER)
+    assert reloaded.get("123", 1)["status"] == "ENABLED"
+    assert reloaded.max_modification_time("123") == "2026-10-01T10:00:00.000"
+    assert reloaded.is_fresh("123")
+    assert [p.name for p in path.parent.iterdir()] == ["campaigns.json"]
+
+
+def test_unreadable_file_is_treated_as_empty(tmp_path, caplog):
+    path = tmp_path / "campaigns.json"
+    path.write_text('{"123": {"refreshed_at"')
+
+    cache = CampaignMetadataCache(path=str(path), ttl=60, logger=LOGGER)
+
+    assert cache.get("123", 1) is None
+    assert not cache.is_fresh("123")
+    assert "Ignoring unreadable campaign cache file" in caplog.text
+
+
+def test_non_object_file_is_treated_as_empty(tmp_path, caplog):
+    path = tmp_path / "campaigns.json"
+    path.write_text("[]")
+
+    cache = CampaignMetadataCache(path=str(path), ttl=60, logger=LOGGER)
+    cache.update("123", {"id": 1, "status": "ENABLED"})
+
+    assert cache.get("123", 1)["status"] == "ENABLED"
+    assert "Ignoring unreadable campaign cache file" in caplog.text
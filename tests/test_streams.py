@@ -0,0 +1,272 @@
+"""Tests for the AppleSearchAds streams."""
+
+from __future__ import annotations
+
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from tap_apple_search_ads.client import PAGE_LIMIT, AppleSearchAdsStream
+from tap_apple_search_ads.streams import PAGE_CHECKPOINT_KEY, CampaignMetadataStream
+from tap_apple_search_ads.tap import TapAppleSearchAds
+
+CONFIG = {
+    "org_id": "123",
+    "client_id": "client-id",
+    "client_secret": "client-secret",
+    "report_granularity": "DAILY",
+    "checkpoint_report_pages": True,
+}
+
+
+def make_json_response(content: dict) -> requests.Response:
+    """Build a successful response with a JSON body."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(content).encode()  # noqa: SLF001
+    return response
+
+
+def make_response(campaign_ids: list[int]) -> requests.Response:
+    """Build a granular report response with one row per campaign."""
+    return make_json_response(
+        {
+            "data": {
+                "reportingDataResponse": {
+                    "row": [
+                        {
+                            "metadata": {"campaignId": campaign_id},
+                            "granularity": [{"date": "2026-10-01", "impressions": 1}],
+                        }
+                        for campaign_id in campaign_ids
+                    ],
+                },
+            },
+        }
+    )
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    """Return the campaign granular reports stream without authentication."""
+    monkeypatch.setattr(AppleSearchAdsStream, "authenticator", None)
+    tap = TapAppleSearchAds(config=CONFIG, parse_env_config=False)
+    return tap.streams["campaign_granular_reports"]
+
+
+@pytest.fixture
+def requests_sent(stream, monkeypatch):
+    """Serve pages of campaigns 1-2, 3-4 and then an empty page.
+
+    Each sent request is recorded together with the checkpoint in state at that time.
+    """
+    pages = [[1, 2], [3, 4], []]
+    sent = []
+
+    def send(prepared_request, **kwargs):  # noqa: ARG001
+        sent.append(
+            {
+                "body": json.loads(prepared_request.body),
+                "checkpoint": copy.deepcopy(stream.get_context_state(None).get(PAGE_CHECKPOINT_KEY)),
+            }
+        )
+        return make_response(pages[len(sent) - 1])
+
+    monkeypatch.setattr(stream.requests_session, "send", send)
+    return sent
+
+
+def set_checkpoint(stream, **overrides) -> dict:
+    """Store a valid page checkpoint in the stream state."""
+    today = datetime.now(tz=timezone.utc)
+    checkpoint = {
+        "org_id": "123",
+        "granularity": "DAILY",
+        "window_start": (today - timedelta(days=10)).strftime("%Y-%m-%d"),
+        "window_end": today.strftime("%Y-%m-%d"),
+        "offset": PAGE_LIMIT,
+        "last_emitted_id": 3,
+        **overrides,
+    }
+    stream.get_context_state(None)[PAGE_CHECKPOINT_KEY] = checkpoint
+    return checkpoint
+
+
+def test_checkpoint_written_before_next_page(stream, requests_sent):
+    records = list(stream.get_records(None))
+
+    assert [record["campaignId"] for record in records] == [1, 2, 3, 4]
+    assert requests_sent[0]["checkpoint"] is None
+    checkpoint = requests_sent[1]["checkpoint"]
+    assert checkpoint["offset"] == PAGE_LIMIT
+    assert checkpoint["last_emitted_id"] == 2
+    assert checkpoint["org_id"] == "123"
+    assert checkpoint["window_start"] == requests_sent[0]["body"]["startTime"]
+    assert checkpoint["window_end"] == requests_sent[0]["body"]["endTime"]
+
+
+def test_checkpoint_removed_after_full_pass(stream, requests_sent):
+    list(stream.get_records(None))
+
+    assert len(requests_sent) == 3
+    assert PAGE_CHECKPOINT_KEY not in stream.get_context_state(None)
+
+
+def test_resume_from_checkpoint(stream, requests_sent):
+    checkpoint = set_checkpoint(stream)
+
+    records = list(stream.get_records(None))
+
+    body = requests_sent[0]["body"]
+    assert body["selector"]["pagination"]["offset"] == PAGE_LIMIT
+    assert body["startTime"] == checkpoint["window_start"]
+    assert body["endTime"] == checkpoint["window_end"]
+    # Campaigns up to and including the last emitted id were synced before the crash.
+    assert [record["campaignId"] for record in records] == [4]
+    assert PAGE_CHECKPOINT_KEY not in stream.get_context_state(None)
+
+
+def test_resume_builds_paginator_at_checkpoint_offset(stream):
+    set_checkpoint(stream, offset=3 * PAGE_LIMIT)
+    stream._restore_page_checkpoint(None)  # noqa: SLF001
+
+    assert stream.get_new_paginator().current_value == 3 * PAGE_LIMIT
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        pytest.param({"granularity": "WEEKLY"}, id="other-granularity"),
+        pytest.param({"org_id": "456"}, id="other-org"),
+        pytest.param({"window_start": "2000-01-01"}, id="window-out-of-range"),
+        pytest.param({"window_start": "not-a-date"}, id="malformed-date"),
+        pytest.param({"offset": None}, id="malformed-offset"),
+        pytest.param({"window_end": None}, id="missing-window-end"),
+        pytest.param({"offset": True}, id="bool-offset"),
+        pytest.param({"last_emitted_id": "3"}, id="malformed-last-emitted-id"),
+        pytest.param({"last_emitted_id": True}, id="bool-last-emitted-id"),
+    ],
+)
+def test_invalid_checkpoint_is_ignored(stream, requests_sent, overrides):
+    set_checkpoint(stream, **overrides)
+
+    records = list(stream.get_records(None))
+
+    assert requests_sent[0]["body"]["selector"]["pagination"]["offset"] == 0
+    assert [record["campaignId"] for record in records] == [1, 2, 3, 4]
+
+
+def test_sync_resumes_from_emitted_checkpoint(monkeypatch, capsys):
+    monkeypatch.setattr(AppleSearchAdsStream, "authenticator", None)
+    pages = [[1, 2], [3, 4], []]
+    report_requests = []
+
+    def send(self, prepared_request, **kwargs):  # noqa: ARG001
+        body = json.loads(prepared_request.body) if prepared_request.body else {}
+        if "granularity" not in body:
+            # Other streams find no data.
+            return make_json_response({"data": []})
+        report_requests.append(body)
+        offset = body["selector"]["pagination"]["offset"]
+        if len(report_requests) == 3:  # noqa: PLR2004
+            msg = "Sync interrupted"
+            raise RuntimeError(msg)
+        return make_response(pages[offset // PAGE_LIMIT])
+
+    monkeypatch.setattr(requests.Session, "send", send)
+
+    with pytest.raises(RuntimeError, match="Sync interrupted"):
+        TapAppleSearchAds(config=CONFIG, parse_env_config=False).sync_all()
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    states = [message["value"] for message in messages if message["type"] == "STATE"]
+    checkpoint = states[-1]["bookmarks"]["campaign_granular_reports"][PAGE_CHECKPOINT_KEY]
+    assert checkpoint["offset"] == 2 * PAGE_LIMIT
+    assert checkpoint["last_emitted_id"] == 4  # noqa: PLR2004
+
+    # The interrupted page turns out to overlap with the last synced campaign.
+    pages[2] = [4, 5]
+    pages.append([])
+    TapAppleSearchAds(config=CONFIG, state=states[-1], parse_env_config=False).sync_all()
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert report_requests[3]["selector"]["pagination"]["offset"] == 2 * PAGE_LIMIT
+    assert report_requests[3]["startTime"] == checkpoint["window_start"]
+    records = [
+        message["record"]
+        for message in messages
+        if message["type"] == "RECORD" and message["stream"] == "campaign_granular_reports"
+    ]
+    assert [record["campaignId"] for record in records] == [5]
+    final_state = [message["value"] for message in messages if message["type"] == "STATE"][-1]
+    assert PAGE_CHECKPOINT_KEY not in final_state["bookmarks"]["campaign_granular_reports"]
+
+
+@pytest.fixture
+def report_stream(stream):
+    """Return the campaign reports stream of the same tap."""
+    return stream._tap.streams["campaign_reports"]  # noqa: SLF001
+
+
+@pytest.fixture
+def campaign_requests_sent(monkeypatch):
+    """Serve one page with campaign 2 to campaign metadata requests and record their bodies."""
+    pages = [
+        [{"id": 2, "status": "PAUSED", "modificationTime": "2026-10-02T10:00:00.000"}],
+        [],
+    ]
+    sent = []
+
+    def send(self, prepared_request, **kwargs):  # noqa: ARG001
+        sent.append(json.loads(prepared_request.body))
+        return make_json_response({"data": pages[len(sent) - 1]})
+
+    monkeypatch.setattr(requests.Session, "send", send)
+    return sent
+
+
+def test_campaign_metadata_refreshed_when_expired(report_stream, campaign_requests_sent):
+    cache = report_stream.campaign_cache
+    cache.update("123", {"id": 1, "status": "ENABLED", "modificationTime": "2026-10-01T10:00:00.000"})
+
+    assert report_stream.get_campaign_metadata(2, None)["status"] == "PAUSED"
+    assert report_stream.get_campaign_metadata(1, None)["status"] == "ENABLED"
+    assert cache.is_fresh("123")
+    assert campaign_requests_sent[0]["conditions"] == [
+        {"field": "modificationTime", "operator": "GREATER_THAN", "values": ["2026-10-01T09:59:00.000"]},
+    ]
+    assert campaign_requests_sent[0]["pagination"] == {"offset": 0, "limit": PAGE_LIMIT}
+
+
+def test_campaign_metadata_full_listing_when_empty(report_stream, campaign_requests_sent):
+    assert report_stream.get_campaign_metadata(2, None)["status"] == "PAUSED"
+    assert "conditions" not in campaign_requests_sent[0]
+
+
+def test_fresh_campaign_metadata_makes_no_request(report_stream, campaign_requests_sent):
+    cache = report_stream.campaign_cache
+    cache.update("123", {"id": 1, "status": "ENABLED"})
+    cache.mark_refreshed("123")
+
+    assert report_stream.get_campaign_metadata(1, None)["status"] == "ENABLED"
+    assert report_stream.get_campaign_metadata(2, None) is None
+    assert campaign_requests_sent == []
+
+
+def test_campaign_metadata_stream_is_not_discovered(stream):
+    tap = stream._tap  # noqa: SLF001
+    assert not any(isinstance(s, CampaignMetadataStream) for s in tap.streams.values())
+
+
+def test_campaign_metadata_for_partitioned_org(monkeypatch, campaign_requests_sent):
+    monkeypatch.setattr(AppleSearchAdsStream, "authenticator", None)
+    config = {**CONFIG, "org_ids": ["123", "456"]}
+    report_stream = TapAppleSearchAds(config=config, parse_env_config=False).streams["campaign_reports"]
+    report_stream.campaign_cache.update("123", {"id": 2, "status": "ENABLED"})
+    report_stream.campaign_cache.mark_refreshed("123")
+
+    assert report_stream.get_campaign_metadata(2, {"org_id": "456"})["status"] == "PAUSED"
+    assert report_stream.get_campaign_metadata(2, {"org_id": "123"})["status"] == "ENABLED"
+    assert len(campaign_requests_sent) == 2  # noqa: PLR2004